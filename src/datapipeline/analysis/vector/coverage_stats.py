@@ -19,51 +19,58 @@ class _Counts:
     present_samples: int = 0
     non_null_samples: int = 0
     observed_elements: int = 0
+    # Last sample that counted this base, so repeated columns count once.
+    present_mark: int = -1
+    non_null_mark: int = -1
 
 
 class CoverageStatsAccumulator:
     """Collect bounded availability counters for one vector section."""
 
     def __init__(self, entries: Sequence[VectorMetadataEntry]) -> None:
-        self._entries = {entry.id: entry for entry in entries}
         self._bases = {entry.base_id: _Counts() for entry in entries}
-        self._columns = {entry.id: _Counts() for entry in entries}
+        self._columns = {
+            entry.id: (entry, _Counts(), self._bases[entry.base_id])
+            for entry in entries
+        }
+        self._samples = 0
 
     def update(self, values: Mapping[str, Any]) -> None:
-        present_bases: set[str] = set()
-        non_null_bases: set[str] = set()
+        columns = self._columns
+        sample = self._samples
+        self._samples += 1
 
         for identifier, value in values.items():
-            entry = self._entries.get(identifier)
-            if entry is None:
+            column = columns.get(identifier)
+            if column is None:
                 raise ValueError(
                     f"Vector contains ID {identifier!r} missing from metadata. "
                     "Rebuild vector metadata."
                 )
 
-            present_bases.add(entry.base_id)
-            counts = self._columns[identifier]
+            entry, counts, base = column
             counts.present_samples += 1
+            if base.present_mark != sample:
+                base.present_mark = sample
+                base.present_samples += 1
 
-            if isinstance(entry, ListVectorMetadataEntry):
+            if entry.kind == "list":
                 observed = _observed_list_elements(entry, value)
                 counts.observed_elements += observed
-                if observed:
-                    counts.non_null_samples += 1
-                    non_null_bases.add(entry.base_id)
+                if not observed:
+                    continue
             else:
                 if isinstance(value, list):
                     raise ValueError(
                         f"Scalar vector {identifier!r} contains a list value."
                     )
-                if not is_missing(value):
-                    counts.non_null_samples += 1
-                    non_null_bases.add(entry.base_id)
+                if is_missing(value):
+                    continue
 
-        for base_id in present_bases:
-            self._bases[base_id].present_samples += 1
-        for base_id in non_null_bases:
-            self._bases[base_id].non_null_samples += 1
+            counts.non_null_samples += 1
+            if base.non_null_mark != sample:
+                base.non_null_mark = sample
+                base.non_null_samples += 1
 
     def finish(self) -> CoverageStatsSection:
         bases = tuple(
@@ -75,8 +82,7 @@ class CoverageStatsAccumulator:
             for identifier, counts in sorted(self._bases.items())
         )
         columns: list[CoverageColumnStats] = []
-        for identifier, entry in sorted(self._entries.items()):
-            counts = self._columns[identifier]
+        for identifier, (entry, counts, _) in sorted(self._columns.items()):
             if isinstance(entry, ListVectorMetadataEntry):
                 columns.append(
                     ListCoverageColumnStats(
@@ -115,4 +121,4 @@ def _observed_list_elements(
         raise ValueError(
             f"List vector {entry.id!r} has length {len(value)}; expected {expected}."
         )
-    return sum(not is_missing(element) for element in value)
+    return expected - sum(map(is_missing, value))
@@ -3,6 +3,7 @@ import html
 import json
 from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from itertools import groupby
 from typing import Any, Literal
 
 from datapipeline.artifacts.models import (
@@ -17,20 +18,26 @@ _ABSENT = object()
 _STATUS_CODE = {"absent": 0, "present": 1, "null": 2}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatrixCell:
     status: Status
     elements: tuple[Status, ...] = ()
 
 
-@dataclass(frozen=True)
+# Scalar cells carry no per-sample data, so every row shares these instances.
+_ABSENT_CELL = MatrixCell("absent")
+_PRESENT_CELL = MatrixCell("present")
+_NULL_CELL = MatrixCell("null")
+
+
+@dataclass(frozen=True, slots=True)
 class MatrixRow:
     group: str
     features: tuple[MatrixCell, ...]
     targets: tuple[MatrixCell, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AvailabilityMatrix:
     feature_ids: tuple[str, ...]
     target_ids: tuple[str, ...]
@@ -71,8 +78,8 @@ class MatrixBuilder:
     ) -> None:
         self._feature_entries = tuple(feature_entries)
         self._target_entries = tuple(target_entries)
-        self._feature_ids = {entry.id for entry in feature_entries}
-        self._target_ids = {entry.id for entry in target_entries}
+        self._feature_ids = frozenset(entry.id for entry in feature_entries)
+        self._target_ids = frozenset(entry.id for entry in target_entries)
         self._max_cells = max_cells
         self._row_width = sum(
             _entry_width(entry)
@@ -86,16 +93,14 @@ class MatrixBuilder:
         features: Mapping[str, Any],
         targets: Mapping[str, Any],
     ) -> None:
-        unknown_features = set(features) - self._feature_ids
-        if unknown_features:
-            identifier = min(unknown_features)
+        if not self._feature_ids.issuperset(features):
+            identifier = min(features.keys() - self._feature_ids)
             raise ValueError(
                 f"Feature vector contains ID {identifier!r} missing from metadata. "
                 "Rebuild vector metadata."
             )
-        unknown_targets = set(targets) - self._target_ids
-        if unknown_targets:
-            identifier = min(unknown_targets)
+        if not self._target_ids.issuperset(targets):
+            identifier = min(targets.keys() - self._target_ids)
             raise ValueError(
                 f"Target vector contains ID {identifier!r} missing from metadata. "
                 "Rebuild vector metadata."
@@ -142,8 +147,8 @@ def _cells(
 
 def _cell(entry: VectorMetadataEntry, value: object) -> MatrixCell:
     if value is _ABSENT:
-        return MatrixCell("absent")
-    if isinstance(entry, ListVectorMetadataEntry):
+        return _ABSENT_CELL
+    if entry.kind == "list":
         if is_missing(value):
             null: Status = "null"
             elements = (null,) * entry.length
@@ -162,7 +167,7 @@ def _cell(entry: VectorMetadataEntry, value: object) -> MatrixCell:
         return MatrixCell(status, elements)
     if isinstance(value, list):
         raise ValueError(f"Scalar vector {entry.id!r} contains a list value.")
-    return MatrixCell("null" if is_missing(value) else "present")
+    return _NULL_CELL if is_missing(value) else _PRESENT_CELL
 
 
 def _format_group_key(group_key: object) -> str:
@@ -224,7 +229,7 @@ def _html_table(
 
     payload = {
         "rows": row_labels,
-        "encoded": base64.b64encode(bytes(codes)).decode("ascii"),
+        "runs": base64.b64encode(_run_length_encode(codes)).decode("ascii"),
         "sub": sub,
         "columns": len(identifiers),
     }
@@ -242,6 +247,19 @@ def _html_table(
     )
 
 
+def _run_length_encode(codes: bytes | bytearray) -> bytes:
+    """Encode status codes as (code, ULEB128 run length) pairs."""
+    encoded = bytearray()
+    for code, run in groupby(codes):
+        length = sum(1 for _ in run)
+        encoded.append(code)
+        while length > 0x7F:
+            encoded.append(length & 0x7F | 0x80)
+            length >>= 7
+        encoded.append(length)
+    return bytes(encoded)
+
+
 _STYLE = """
 * { box-sizing: border-box; }
 body { margin: 24px; background: #f7f7f8; color: #222; font-family: sans-serif; }
@@ -272,11 +290,16 @@ _SCRIPT = """
 function setupMatrix(id, payload) {
   const container = document.getElementById(id + '-container');
   const body = document.getElementById(id + '-body');
-  const raw = atob(payload.encoded);
-  const data = Uint8Array.from(raw, c => c.charCodeAt(0));
-  const classes = ['absent', 'present', 'null'];
+  const data = decodeRuns(atob(payload.runs), payload.rows.length * payload.columns);
+  const statuses = ['absent', 'present', 'null'];
+  const classes = Array.from({ length: 256 }, (_, code) => statuses[code] || 'absent');
   const rowHeight = 28;
+  const topSpacer = spacer();
+  const bottomSpacer = spacer();
+  const pool = [];
   let previousStart = -1;
+  let pendingFrame = 0;
+  body.append(topSpacer, bottomSpacer);
 
   function render() {
     const buffer = 20;
@@ -285,40 +308,108 @@ function setupMatrix(id, payload) {
     const end = Math.min(payload.rows.length, start + count);
     if (start === previousStart) return;
     previousStart = start;
-    let output = '';
-    if (start) output += spacer(start * rowHeight);
-    for (let row = start; row < end; row++) output += matrixRow(row);
-    if (end < payload.rows.length) output += spacer((payload.rows.length - end) * rowHeight);
-    body.innerHTML = output;
+    while (pool.length < end - start) {
+      const row = matrixRow();
+      pool.push(row);
+      body.insertBefore(row, bottomSpacer);
+    }
+    for (let offset = 0; offset < pool.length; offset++) {
+      const row = pool[offset];
+      row.hidden = start + offset >= end;
+      if (!row.hidden) fillRow(row, start + offset);
+    }
+    resizeSpacer(topSpacer, start * rowHeight);
+    resizeSpacer(bottomSpacer, (payload.rows.length - end) * rowHeight);
   }
 
-  function spacer(height) {
-    return `<tr><td colspan="${body.dataset.colspan}" style="height:${height}px;border:0"></td></tr>`;
+  function spacer() {
+    const row = document.createElement('tr');
+    const cell = document.createElement('td');
+    cell.colSpan = Number(body.dataset.colspan);
+    cell.style.border = '0';
+    row.append(cell);
+    return row;
   }
 
-  function matrixRow(row) {
-    let cells = '';
+  function resizeSpacer(row, height) {
+    row.hidden = !height;
+    row.firstChild.style.height = height + 'px';
+  }
+
+  function matrixRow() {
+    const row = document.createElement('tr');
+    const label = document.createElement('th');
+    label.scope = 'row';
+    label.className = 'group';
+    row.append(label);
     for (let column = 0; column < payload.columns; column++) {
-      const index = row * payload.columns + column;
-      const status = classes[data[index]] || 'absent';
-      const elements = payload.sub[index];
+      row.append(document.createElement('td'));
+    }
+    return row;
+  }
+
+  function fillRow(row, index) {
+    const cells = row.children;
+    cells[0].textContent = payload.rows[index];
+    for (let column = 0; column < payload.columns; column++) {
+      const position = index * payload.columns + column;
+      const status = classes[data[position]];
+      const elements = payload.sub[position];
+      const cell = cells[column + 1];
+      cell.title = status;
       if (elements && elements.length) {
-        const spans = elements.map(code => `<span class="${classes[code] || 'absent'}"></span>`).join('');
-        cells += `<td title="${status}"><div class="sub">${spans}</div></td>`;
+        cell.className = '';
+        fillSubCells(cell, elements);
       } else {
-        cells += `<td class="${status}" title="${status}"></td>`;
+        cell.className = status;
+        if (cell.firstChild) cell.replaceChildren();
       }
     }
-    return `<tr><th scope="row" class="group">${escapeHtml(payload.rows[row])}</th>${cells}</tr>`;
   }
 
-  function escapeHtml(value) {
-    return String(value).replace(/[&<>"']/g, character => ({
-      '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#039;'
-    })[character]);
+  function fillSubCells(cell, elements) {
+    let sub = cell.firstChild;
+    if (!sub) {
+      sub = document.createElement('div');
+      sub.className = 'sub';
+      cell.append(sub);
+    }
+    while (sub.children.length < elements.length) {
+      sub.append(document.createElement('span'));
+    }
+    while (sub.children.length > elements.length) sub.lastChild.remove();
+    for (let element = 0; element < elements.length; element++) {
+      sub.children[element].className = classes[elements[element]];
+    }
+  }
+
+  function decodeRuns(raw, size) {
+    const codes = new Uint8Array(size);
+    let offset = 0;
+    let index = 0;
+    while (index < raw.length) {
+      const code = raw.charCodeAt(index++);
+      let length = 0;
+      let scale = 1;
+      let byte;
+      do {
+        byte = raw.charCodeAt(index++);
+        length += (byte & 0x7f) * scale;
+        scale *= 128;
+      } while (byte & 0x80);
+      codes.fill(code, offset, offset + length);
+      offset += length;
+    }
+    return codes;
   }
 
-  container.addEventListener('scroll', () => requestAnimationFrame(render));
+  container.addEventListener('scroll', () => {
+    if (pendingFrame) return;
+    pendingFrame = requestAnimationFrame(() => {
+      pendingFrame = 0;
+      render();
+    });
+  }, { passive: true });
   render();
 }
 """
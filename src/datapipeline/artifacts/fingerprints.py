@@ -30,10 +30,11 @@ ARTIFACT_CACHE_VERSION = 7
 
 
 def _normalized_label(path: Path, base_dir: Path) -> str:
+    resolved = path.resolve()
     try:
-        return str(path.resolve().relative_to(base_dir))
+        return str(resolved.relative_to(base_dir))
     except ValueError:
-        return str(path.resolve())
+        return str(resolved)
 
 
 def _source_label(path: Path, base_dir: Path) -> str:
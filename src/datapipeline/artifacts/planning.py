@@ -45,6 +45,10 @@ class ArtifactGraph:
         init=False,
         repr=False,
     )
+    _dependents_by_key: Mapping[str, tuple[str, ...]] = field(
+        init=False,
+        repr=False,
+    )
 
     def __post_init__(self) -> None:
         definitions_by_key: dict[str, ArtifactDefinition] = {}
@@ -53,12 +57,16 @@ class ArtifactGraph:
                 raise ValueError(f"Duplicate artifact key '{definition.key}'.")
             definitions_by_key[definition.key] = definition
 
+        dependents_by_key: dict[str, list[str]] = {
+            key: [] for key in definitions_by_key
+        }
         for definition in self.definitions:
             for dependency in definition.dependencies:
                 if dependency not in definitions_by_key:
                     raise ValueError(
                         f"Artifact '{definition.key}' has unknown dependency '{dependency}'."
                     )
+                dependents_by_key[dependency].append(definition.key)
 
         for task_id, task in self.tasks_by_id.items():
             if task_id != task.id:
@@ -81,6 +89,13 @@ class ArtifactGraph:
             "_definitions_by_key",
             MappingProxyType(definitions_by_key),
         )
+        object.__setattr__(
+            self,
+            "_dependents_by_key",
+            MappingProxyType(
+                {key: tuple(keys) for key, keys in dependents_by_key.items()}
+            ),
+        )
         self._validate_acyclic()
 
     @classmethod
@@ -255,17 +270,13 @@ class ArtifactGraph:
             self.definition(key)
 
         selected: set[str] = set()
-
-        def include(key: str) -> None:
+        pending = list(root_keys)
+        while pending:
+            key = pending.pop()
             if key in selected:
-                return
+                continue
             selected.add(key)
-            for dependency in self.definition(key).dependencies:
-                include(dependency)
-
-        for definition in self.definitions:
-            if definition.key in root_keys:
-                include(definition.key)
+            pending.extend(self._definitions_by_key[key].dependencies)
         return self.topological_order(selected)
 
     def active_dependency_closure(
@@ -278,20 +289,18 @@ class ArtifactGraph:
             self.definition(key)
 
         selected: set[str] = set()
-
-        def include(key: str) -> None:
-            if key in selected:
-                return
-            definition = self.definition(key)
+        skipped: set[str] = set()
+        pending = list(root_keys)
+        while pending:
+            key = pending.pop()
+            if key in selected or key in skipped:
+                continue
+            definition = self._definitions_by_key[key]
             if not definition.is_required_for(dataset):
-                return
+                skipped.add(key)
+                continue
             selected.add(key)
-            for dependency in definition.dependencies:
-                include(dependency)
-
-        for definition in self.definitions:
-            if definition.key in root_keys:
-                include(definition.key)
+            pending.extend(definition.dependencies)
         return self.topological_order(selected)
 
     def topological_order(self, keys: Iterable[str]) -> tuple[str, ...]:
@@ -342,15 +351,11 @@ class ArtifactGraph:
         pending = list(roots)
         while pending:
             dependency = pending.pop()
-            for definition in self.definitions:
-                if definition.key not in active or definition.key in roots:
-                    continue
-                if dependency not in definition.dependencies:
-                    continue
-                if definition.key in dependents:
+            for key in self._dependents_by_key.get(dependency, ()):
+                if key not in active or key in roots or key in dependents:
                     continue
-                dependents.add(definition.key)
-                pending.append(definition.key)
+                dependents.add(key)
+                pending.append(key)
         return dependents
 
     def freshness(
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 from dataclasses import dataclass
+from itertools import chain
 
 from datapipeline.config.dataset.dataset import DatasetConfig
 
@@ -25,7 +26,7 @@ class ArtifactDefinition:
 
 
 def dataset_requires_scaler(dataset: DatasetConfig) -> bool:
-    return any(config.scale for config in dataset.series)
+    return any(config.scale for config in chain(dataset.features, dataset.targets))
 
 
 ARTIFACT_DEFINITIONS: tuple[ArtifactDefinition, ...] = (
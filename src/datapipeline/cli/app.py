@@ -1,21 +1,17 @@
+from __future__ import annotations
+
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from datapipeline.cli.command_router import execute_command
-from datapipeline.cli.workspace import WorkspaceContext, load_workspace_context
-from datapipeline.cli.logging_setup import (
-    configure_root_logging,
-    parse_log_output_specs,
-)
 from datapipeline.cli.parser_builder import build_parser
-from datapipeline.execution.settings import (
-    LogOutputTarget,
-    resolve_log_level,
-    resolve_log_output,
-)
 from datapipeline.services.path_policy import resolve_workspace_path, workspace_cwd
 
+if TYPE_CHECKING:
+    from datapipeline.cli.workspace import WorkspaceContext
+    from datapipeline.execution.settings import LogOutputTarget
+
 
 def _dataset_to_project_path(
     dataset: str,
@@ -93,6 +89,12 @@ def _configure_cli_logging(
     args: argparse.Namespace,
     workspace_context: WorkspaceContext | None,
 ) -> tuple[str | None, str, list[LogOutputTarget]]:
+    from datapipeline.cli.logging_setup import (
+        configure_root_logging,
+        parse_log_output_specs,
+    )
+    from datapipeline.execution.settings import resolve_log_level, resolve_log_output
+
     cli_level_arg = args.log_level
     cli_log_output_specs = args.log_output
 
@@ -122,6 +124,11 @@ def _configure_cli_logging(
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+    # Deferred until parsing succeeds, so --help, --version and usage errors
+    # exit without loading the workspace, logging and command modules.
+    from datapipeline.cli.command_router import execute_command
+    from datapipeline.cli.workspace import load_workspace_context
+
     workspace_context = None
     if args.cmd not in {"version", "env", "clean"}:
         try:
@@ -1,26 +1,6 @@
 import argparse
 from pathlib import Path
 
-from datapipeline.cli.commands.clean import handle as handle_clean
-from datapipeline.cli.commands.demo import handle as handle_demo
-from datapipeline.cli.commands.domain import handle as handle_domain
-from datapipeline.cli.commands.dto import handle as handle_dto
-from datapipeline.cli.commands.inflow import handle as handle_inflow
-from datapipeline.cli.commands.list_ import handle as handle_list
-from datapipeline.cli.commands.loader import handle as handle_loader
-from datapipeline.cli.commands.mapper import handle as handle_mapper
-from datapipeline.cli.commands.materialize import handle as handle_materialize
-from datapipeline.cli.commands.parser import handle as handle_parser
-from datapipeline.cli.commands.plugin import handle as handle_plugin
-from datapipeline.cli.commands.profile_runner import (
-    handle_build,
-    handle_inspect,
-    handle_serve,
-)
-from datapipeline.cli.commands.source import handle as handle_source
-from datapipeline.cli.commands.stream import handle as handle_stream_create
-from datapipeline.cli.commands.version import handle as handle_version
-from datapipeline.cli.commands.version import handle_env
 from datapipeline.cli.workspace import WorkspaceContext
 from datapipeline.execution.settings import LogOutputTarget
 
@@ -33,12 +13,19 @@ def execute_command(
     base_level_name: str,
     cli_log_outputs: list[LogOutputTarget],
 ) -> None:
+    # Handlers are imported per command so each run only loads what it uses.
     match args.cmd:
         case "version":
+            from datapipeline.cli.commands.version import handle as handle_version
+
             handle_version()
         case "env":
+            from datapipeline.cli.commands.version import handle_env
+
             handle_env()
         case "build":
+            from datapipeline.cli.commands.profile_runner import handle_build
+
             handle_build(
                 args=args,
                 cli_log_level=cli_level_arg,
@@ -46,6 +33,8 @@ def execute_command(
                 cli_log_outputs=cli_log_outputs,
             )
         case "serve":
+            from datapipeline.cli.commands.profile_runner import handle_serve
+
             handle_serve(
                 args=args,
                 workspace=workspace_context,
@@ -54,6 +43,8 @@ def execute_command(
                 cli_log_outputs=cli_log_outputs,
             )
         case "inspect":
+            from datapipeline.cli.commands.profile_runner import handle_inspect
+
             handle_inspect(
                 args=args,
                 workspace=workspace_context,
@@ -62,8 +53,14 @@ def execute_command(
                 cli_log_outputs=cli_log_outputs,
             )
         case "clean":
+            from datapipeline.cli.commands.clean import handle as handle_clean
+
             handle_clean(yes=args.yes, older_than=args.older_than)
         case "materialize":
+            from datapipeline.cli.commands.materialize import (
+                handle as handle_materialize,
+            )
+
             handle_materialize(
                 project=args.project,
                 profile_name=args.profile,
@@ -78,6 +75,8 @@ def execute_command(
                 workspace=workspace_context,
             )
         case "source":
+            from datapipeline.cli.commands.source import handle as handle_source
+
             handle_source(
                 source_id=args.source_id,
                 transport=args.transport,
@@ -88,39 +87,59 @@ def execute_command(
                 workspace=workspace_context,
             )
         case "list":
+            from datapipeline.cli.commands.list_ import handle as handle_list
+
             handle_list(
                 subcmd=args.list_cmd,
                 plugin_root=plugin_root,
                 workspace=workspace_context,
             )
         case "domain":
+            from datapipeline.cli.commands.domain import handle as handle_domain
+
             handle_domain(
                 domain=args.domain_name,
                 plugin_root=plugin_root,
             )
         case "dto":
+            from datapipeline.cli.commands.dto import handle as handle_dto
+
             handle_dto(name=args.name, plugin_root=plugin_root)
         case "parser":
+            from datapipeline.cli.commands.parser import handle as handle_parser
+
             handle_parser(name=args.name, plugin_root=plugin_root)
         case "mapper":
+            from datapipeline.cli.commands.mapper import handle as handle_mapper
+
             handle_mapper(name=args.name, plugin_root=plugin_root)
         case "loader":
+            from datapipeline.cli.commands.loader import handle as handle_loader
+
             handle_loader(name=args.name, plugin_root=plugin_root)
         case "inflow":
+            from datapipeline.cli.commands.inflow import handle as handle_inflow
+
             handle_inflow(plugin_root=plugin_root, workspace=workspace_context)
         case "stream":
+            from datapipeline.cli.commands.stream import handle as handle_stream_create
+
             handle_stream_create(
                 plugin_root=plugin_root,
                 use_identity=args.identity,
                 workspace=workspace_context,
             )
         case "plugin":
+            from datapipeline.cli.commands.plugin import handle as handle_plugin
+
             handle_plugin(
                 name=args.plugin_name,
                 out=args.out,
                 workspace=workspace_context,
             )
         case "demo":
+            from datapipeline.cli.commands.demo import handle as handle_demo
+
             handle_demo(
                 subcmd=args.demo_cmd,
                 out=args.out,
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 from datapipeline.cli.workspace import WorkspaceContext, resolve_default_project_yaml
@@ -29,24 +30,19 @@ def handle(
             streams = load_streams(load_project(proj_path))
         except FileNotFoundError as exc:
             raise SystemExit(str(exc)) from None
-        aliases = sorted(streams.sources)
-        for alias in aliases:
-            print(alias)
+        names = sorted(streams.sources)
     elif subcmd == "domains":
-        for k in list_domains(root=plugin_root):
-            print(k)
+        names = list(list_domains(root=plugin_root))
     elif subcmd == "parsers":
-        for k in sorted(list_parsers(root=plugin_root).keys()):
-            print(k)
+        names = sorted(list_parsers(root=plugin_root))
     elif subcmd == "mappers":
-        for k in sorted(list_mappers(root=plugin_root).keys()):
-            print(k)
+        names = sorted(list_mappers(root=plugin_root))
     elif subcmd == "combiners":
-        for k in sorted(list_combiners(root=plugin_root).keys()):
-            print(k)
+        names = sorted(list_combiners(root=plugin_root))
     elif subcmd == "loaders":
-        for k in sorted(list_loaders(root=plugin_root).keys()):
-            print(k)
+        names = sorted(list_loaders(root=plugin_root))
     elif subcmd == "dtos":
-        for k in sorted(list_dtos(root=plugin_root).keys()):
-            print(k)
+        names = sorted(list_dtos(root=plugin_root))
+    else:
+        return
+    sys.stdout.write("".join(f"{name}\n" for name in names))
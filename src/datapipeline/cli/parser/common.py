@@ -1,8 +1,11 @@
 import argparse
 import math
 
-from datapipeline.config.options import VISUAL_CHOICES
-from datapipeline.config.profiles import ARTIFACT_MODES
+from datapipeline.config.options import (
+    ARTIFACT_MODES,
+    LOG_LEVEL_CHOICES,
+    VISUAL_CHOICES,
+)
 
 
 def _heartbeat_interval_seconds(value: str) -> float:
@@ -78,7 +81,7 @@ def build_logging_parent(suppress_defaults: bool = False) -> argparse.ArgumentPa
     common = argparse.ArgumentParser(add_help=False)
     common.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=LOG_LEVEL_CHOICES,
         type=str.upper,
         default=default,
         help="set logging level (default: INFO)",
@@ -2,9 +2,13 @@ from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-from datapipeline.config.options import LOG_SCOPE_CHOICES, LOG_TRANSPORT_CHOICES
+from datapipeline.config.options import (
+    LOG_LEVEL_CHOICES,
+    LOG_SCOPE_CHOICES,
+    LOG_TRANSPORT_CHOICES,
+)
 
-VALID_LOG_LEVELS = ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG")
+VALID_LOG_LEVELS = LOG_LEVEL_CHOICES
 VALID_VISUAL_PROVIDERS = ("ON", "OFF")
 VALID_LOG_TRANSPORTS = tuple(value.upper() for value in LOG_TRANSPORT_CHOICES)
 VALID_LOG_SCOPES = tuple(value.upper() for value in LOG_SCOPE_CHOICES)
@@ -1,5 +1,7 @@
 """Option values shared by configuration models and CLI parsers."""
 
+from typing import Literal
+
 OUTPUT_TRANSPORTS = ("stdout", "fs")
 OUTPUT_FORMATS = ("jsonl", "csv", "parquet", "pickle")
 OUTPUT_INSPECT_FORMATS = ("jsonl", "csv", "pickle", "txt", "html")
@@ -7,5 +9,9 @@ OUTPUT_STDOUT_FORMATS = ("jsonl", "txt")
 OUTPUT_VIEWS = ("raw", "flat")
 
 VISUAL_CHOICES = ("on", "off")
+LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 LOG_TRANSPORT_CHOICES = ("stderr", "stdout", "fs")
 LOG_SCOPE_CHOICES = ("global", "execution")
+
+ArtifactMode = Literal["AUTO", "FORCE", "OFF"]
+ARTIFACT_MODES: tuple[ArtifactMode, ...] = ("AUTO", "FORCE", "OFF")
@@ -3,12 +3,10 @@ from typing import Literal
 from pydantic import Field, field_validator
 
 from datapipeline.config.observability import ObservabilityConfig
+from datapipeline.config.options import ARTIFACT_MODES, ArtifactMode
 
 from .base import Profile, normalize_profile_operation
 
-ArtifactMode = Literal["AUTO", "FORCE", "OFF"]
-ARTIFACT_MODES: tuple[ArtifactMode, ...] = ("AUTO", "FORCE", "OFF")
-
 
 def normalize_artifact_mode(value: object) -> ArtifactMode | None:
     if value is None:
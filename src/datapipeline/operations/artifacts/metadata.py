@@ -1,6 +1,6 @@
-from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
 from datapipeline.artifacts.models import (
@@ -33,39 +33,34 @@ ObservedRange = tuple[datetime, datetime]
 
 
 def _collapsed_ranges(
-    grouped: dict[str, list[ObservedRange]],
+    entries: Sequence[VectorMetadataStats],
+    group_of: Callable[[VectorMetadataStats], str],
 ) -> list[ObservedRange]:
-    return [
-        (
-            min(start for start, _ in values),
-            max(end for _, end in values),
-        )
-        for values in grouped.values()
-    ]
-
-
-def _base_ranges(entries: Sequence[VectorMetadataStats]) -> list[ObservedRange]:
-    grouped: dict[str, list[ObservedRange]] = defaultdict(list)
+    grouped: dict[str, ObservedRange] = {}
     for entry in entries:
         start = entry.first_observed
         end = entry.last_observed
         if start is None or end is None:
             continue
-        grouped[entry.base_id].append((start, end))
-    return _collapsed_ranges(grouped)
+        group = group_of(entry)
+        current = grouped.get(group)
+        if current is not None:
+            if current[0] < start:
+                start = current[0]
+            if current[1] > end:
+                end = current[1]
+        grouped[group] = (start, end)
+    return list(grouped.values())
+
+
+def _base_ranges(entries: Sequence[VectorMetadataStats]) -> list[ObservedRange]:
+    return _collapsed_ranges(entries, attrgetter("base_id"))
 
 
 def _partition_ranges(
     entries: Sequence[VectorMetadataStats],
 ) -> list[ObservedRange]:
-    grouped: dict[str, list[ObservedRange]] = defaultdict(list)
-    for entry in entries:
-        start = entry.first_observed
-        end = entry.last_observed
-        if start is None or end is None:
-            continue
-        grouped[entry.id].append((start, end))
-    return _collapsed_ranges(grouped)
+    return _collapsed_ranges(entries, attrgetter("id"))
 
 
 def _range_union(
@@ -95,17 +90,16 @@ def _window_bounds_from_stats(
     target_stats: Sequence[VectorMetadataStats],
     mode: WindowMode,
 ) -> tuple[datetime | None, datetime | None]:
+    if mode == "strict":
+        return _range_intersection(
+            _partition_ranges(feature_stats) + _partition_ranges(target_stats)
+        )
+    # Every observed partition belongs to a base, so base ranges cover them.
     base_ranges = _base_ranges(feature_stats) + _base_ranges(target_stats)
-    partition_ranges = _partition_ranges(feature_stats) + _partition_ranges(
-        target_stats
-    )
-
     if mode == "union":
-        return _range_union(base_ranges if base_ranges else partition_ranges)
+        return _range_union(base_ranges)
     if mode == "intersection":
         return _range_intersection(base_ranges)
-    if mode == "strict":
-        return _range_intersection(partition_ranges)
     raise ValueError(f"Unsupported metadata window mode {mode!r}.")
 
 
@@ -101,8 +101,9 @@ def materialize_ticks(
         try:
             for tick in _unique_ticks(ordered_ticks):
                 rows += 1
-                sink.write_text(json_text(_json_tick_row(tick, task_cfg.grid_by)))
-                sink.write_text("\n")
+                sink.write_text(
+                    json_text(_json_tick_row(tick, task_cfg.grid_by)) + "\n"
+                )
                 write_progress.advance()
             sink.close()
         except BaseException:
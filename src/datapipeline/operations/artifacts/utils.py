@@ -1,6 +1,7 @@
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import NoneType
 from typing import Literal
 
 from datapipeline.artifacts.models import (
@@ -13,13 +14,13 @@ from datapipeline.domain.series_id import base_id as _base_series_id
 from datapipeline.transforms.utils import is_missing
 
 
-def _type_name(value: object) -> str:
-    if value is None:
+def _type_name(value_type: type) -> str:
+    if value_type is NoneType:
         return "null"
-    return type(value).__name__
+    return value_type.__name__
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorMetadataStats:
     id: str
     base_id: str
@@ -35,16 +36,12 @@ class VectorMetadataStats:
 
     def observe(self, value: object, observed_at: datetime | None) -> None:
         if observed_at is not None:
-            self.first_observed = (
-                observed_at
-                if self.first_observed is None
-                else min(self.first_observed, observed_at)
-            )
-            self.last_observed = (
-                observed_at
-                if self.last_observed is None
-                else max(self.last_observed, observed_at)
-            )
+            first = self.first_observed
+            if first is None or observed_at < first:
+                self.first_observed = observed_at
+            last = self.last_observed
+            if last is None or observed_at > last:
+                self.last_observed = observed_at
 
         self.present_count += 1
         if is_missing(value):
@@ -69,10 +66,9 @@ class VectorMetadataStats:
                 )
             self.kind = "list"
             self.list_length = length
-            self.observed_elements += sum(
-                1 for element in value if not is_missing(element)
-            )
-            self.element_types.update(_type_name(element) for element in value)
+            self.observed_elements += length - sum(map(is_missing, value))
+            # Lists are usually homogeneous; name each distinct type once.
+            self.element_types.update(map(_type_name, set(map(type, value))))
             return
 
         if self.kind == "list":
@@ -80,7 +76,7 @@ class VectorMetadataStats:
                 f"Vector {self.id!r} contains both list and scalar values."
             )
         self.kind = "scalar"
-        self.scalar_types.add(_type_name(value))
+        self.scalar_types.add(_type_name(type(value)))
 
 
 class VectorMetadataCollector:
@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import Any
 
 from datapipeline.artifacts.models import (
@@ -13,6 +14,9 @@ from datapipeline.operations.persistence import RuntimeOutput
 from datapipeline.runtime import Runtime
 
 
+_COVERAGE_ORDER = itemgetter("coverage", "id")
+
+
 def _availability(
     present_samples: int,
     non_null_samples: int,
@@ -78,8 +82,8 @@ def _section_report(
 ) -> dict[str, Any]:
     bases = [_base_metric(entry, total_samples) for entry in section.bases]
     columns = [_column_metric(entry, total_samples) for entry in section.columns]
-    bases.sort(key=lambda metric: (metric["coverage"], metric["id"]))
-    columns.sort(key=lambda metric: (metric["coverage"], metric["id"]))
+    bases.sort(key=_COVERAGE_ORDER)
+    columns.sort(key=_COVERAGE_ORDER)
     return {
         "bases": bases,
         "columns": columns,
@@ -11,29 +11,24 @@ def pipeline_yaml_files(root: Path) -> tuple[Path, ...]:
         )
 
     paths: list[Path] = []
-
-    def raise_scan_error(error: OSError) -> None:
-        raise error
-
-    for directory, directory_names, file_names in os.walk(
-        root,
-        onerror=raise_scan_error,
-        followlinks=False,
-    ):
-        directory_path = Path(directory)
-        for name in directory_names:
-            path = directory_path / name
-            if path.is_symlink():
-                raise ValueError(
-                    f"Pipeline configuration directories must not be symlinks: {path}"
-                )
-        for name in file_names:
-            path = directory_path / name
-            if path.suffix not in {".yaml", ".yml"}:
-                continue
-            metadata = path.stat()
-            if not stat.S_ISREG(metadata.st_mode):
-                raise ValueError(f"YAML config is not a regular file: {path}")
-            paths.append(path)
+    pending = [os.fspath(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                # Directory entries carry their file type, so only symlinks
+                # and rejected entries need a stat() call.
+                if entry.is_dir():
+                    if entry.is_symlink():
+                        raise ValueError(
+                            "Pipeline configuration directories must not be "
+                            f"symlinks: {entry.path}"
+                        )
+                    pending.append(entry.path)
+                    continue
+                if os.path.splitext(entry.name)[1] not in {".yaml", ".yml"}:
+                    continue
+                if not entry.is_file() and not stat.S_ISREG(entry.stat().st_mode):
+                    raise ValueError(f"YAML config is not a regular file: {entry.path}")
+                paths.append(Path(entry.path))
 
     return tuple(sorted(paths, key=lambda path: path.relative_to(root).as_posix()))
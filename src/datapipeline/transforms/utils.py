@@ -9,11 +9,8 @@ TRecord = TypeVar("TRecord", bound=TemporalRecord)
 
 
 def is_missing(value: object) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, float) and math.isnan(value):
-        return True
-    return False
+    # isinstance keeps numpy floats; math.isnan returns a plain bool for them.
+    return value is None or (isinstance(value, float) and math.isnan(value))
 
 
 def finite_number(value: Any, field: str) -> float:
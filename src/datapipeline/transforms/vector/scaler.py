@@ -167,9 +167,13 @@ def _scale_scalar(
 
 
 def _finite_number(value: object) -> float:
-    if isinstance(value, bool) or not isinstance(value, Real):
+    # Exact floats skip the comparatively slow numbers.Real ABC check.
+    if type(value) is float:
+        number = value
+    elif isinstance(value, bool) or not isinstance(value, Real):
         raise TypeError(f"Vector value must be numeric or None, got {value!r}.")
-    number = float(value)
+    else:
+        number = float(value)
     if not math.isfinite(number):
         raise ValueError(f"Vector value must be finite, got {value!r}.")
     return number
@@ -6,46 +6,73 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from yaml.constructor import ConstructorError
+from yaml.constructor import ConstructorError, SafeConstructor
 from yaml.nodes import MappingNode
 
+try:
+    from yaml import CSafeLoader as _CSafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _CSafeLoader  # type: ignore[assignment]
 
-class _UniqueKeyLoader(yaml.SafeLoader):
-    def construct_mapping(
-        self, node: MappingNode, deep: bool = False
-    ) -> dict[Any, Any]:
-        keys: set[Any] = set()
-        has_merge_key = False
-        for key_node, _ in node.value:
-            if key_node.tag == "tag:yaml.org,2002:merge":
-                if has_merge_key:
-                    raise ConstructorError(
-                        "while constructing a mapping",
-                        node.start_mark,
-                        "found duplicate key '<<'",
-                        key_node.start_mark,
-                    )
-                has_merge_key = True
-                continue
-            key = self.construct_object(key_node, deep=deep)
-            try:
-                duplicate = key in keys
-            except TypeError as exc:
-                raise ConstructorError(
-                    "while constructing a mapping",
-                    node.start_mark,
-                    "found an unhashable mapping key",
-                    key_node.start_mark,
-                ) from exc
-            if duplicate:
+
+def _construct_unique_mapping(
+    loader: SafeConstructor, node: MappingNode, deep: bool
+) -> dict[Any, Any]:
+    keys: set[Any] = set()
+    has_merge_key = False
+    for key_node, _ in node.value:
+        if key_node.tag == "tag:yaml.org,2002:merge":
+            if has_merge_key:
                 raise ConstructorError(
                     "while constructing a mapping",
                     node.start_mark,
-                    f"found duplicate key {key!r}",
+                    "found duplicate key '<<'",
                     key_node.start_mark,
                 )
-            keys.add(key)
-        return super().construct_mapping(node, deep=deep)
+            has_merge_key = True
+            continue
+        key = loader.construct_object(key_node, deep=deep)
+        try:
+            duplicate = key in keys
+        except TypeError as exc:
+            raise ConstructorError(
+                "while constructing a mapping",
+                node.start_mark,
+                "found an unhashable mapping key",
+                key_node.start_mark,
+            ) from exc
+        if duplicate:
+            raise ConstructorError(
+                "while constructing a mapping",
+                node.start_mark,
+                f"found duplicate key {key!r}",
+                key_node.start_mark,
+            )
+        keys.add(key)
+    return SafeConstructor.construct_mapping(loader, node, deep=deep)
+
+
+class _UniqueKeyLoader(yaml.SafeLoader):
+    def construct_mapping(
+        self, node: MappingNode, deep: bool = False
+    ) -> dict[Any, Any]:
+        return _construct_unique_mapping(self, node, deep)
+
+
+class _FastUniqueKeyLoader(_CSafeLoader):
+    def construct_mapping(
+        self, node: MappingNode, deep: bool = False
+    ) -> dict[Any, Any]:
+        return _construct_unique_mapping(self, node, deep)
+
+
+def _parse_yaml(text: str) -> Any:
+    try:
+        return yaml.load(text, Loader=_FastUniqueKeyLoader)
+    except yaml.YAMLError:
+        # libyaml marks carry no source buffer, so re-parse with the
+        # pure-Python loader to report the offending line and caret.
+        return yaml.load(text, Loader=_UniqueKeyLoader)
 
 
 @dataclass(frozen=True, slots=True)
@@ -76,7 +103,7 @@ def load_ep(group: str, name: str) -> Callable[..., Any]:
 def read_yaml_document(path: Path, require_mapping: bool = True) -> YamlDocument:
     try:
         content = path.read_bytes()
-        data = yaml.load(content.decode("utf-8"), Loader=_UniqueKeyLoader)
+        data = _parse_yaml(content.decode("utf-8"))
     except FileNotFoundError as exc:
         raise FileNotFoundError(f"YAML file not found: {path}") from exc
     except (UnicodeDecodeError, yaml.YAMLError) as exc:
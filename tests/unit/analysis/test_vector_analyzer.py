@@ -1,8 +1,13 @@
 import json
 
+import numpy as np
 import pytest
 
-from datapipeline.analysis.vector.matrix import MatrixBuilder, render_matrix_html
+from datapipeline.analysis.vector.matrix import (
+    MatrixBuilder,
+    _run_length_encode,
+    render_matrix_html,
+)
 from datapipeline.analysis.vector.coverage_stats import CoverageStatsAccumulator
 from datapipeline.artifacts.models import (
     ListCoverageColumnStats,
@@ -75,6 +80,24 @@ def test_coverage_stats_accumulator_keeps_only_bounded_counters() -> None:
     assert not hasattr(accumulator, "group_feature_status")
 
 
+def test_coverage_stats_accumulator_counts_each_base_once_per_sample() -> None:
+    accumulator = CoverageStatsAccumulator(
+        (
+            _scalar("speed__@station:A", "speed"),
+            _scalar("speed__@station:B", "speed"),
+        )
+    )
+
+    accumulator.update({"speed__@station:A": 1.0, "speed__@station:B": 2.0})
+    accumulator.update({"speed__@station:A": None, "speed__@station:B": None})
+    accumulator.update({"speed__@station:B": 3.0})
+    section = accumulator.finish()
+
+    (speed,) = section.bases
+    assert speed.present_samples == 3
+    assert speed.non_null_samples == 2
+
+
 def test_coverage_stats_accumulator_rejects_metadata_drift() -> None:
     accumulator = CoverageStatsAccumulator((_scalar("speed", "speed"),))
 
@@ -152,6 +175,16 @@ def test_coverage_counts_nulls_and_missing_elements_as_uncovered() -> None:
     assert report["below_threshold_columns"] == ["speed", "history"]
 
 
+def test_coverage_counts_numpy_nan_list_elements_as_uncovered() -> None:
+    accumulator = CoverageStatsAccumulator((_sequence("history", "history", 2),))
+    accumulator.update({"history": [np.float64("nan"), np.float64(1.0)]})
+
+    (column,) = accumulator.finish().columns
+
+    assert isinstance(column, ListCoverageColumnStats)
+    assert column.observed_elements == 1
+
+
 def test_matrix_is_bounded_by_rendered_cells_and_preserves_duplicate_labels() -> None:
     builder = MatrixBuilder(
         (_scalar("speed", "speed"), _sequence("history", "history", 2)),
@@ -205,3 +238,10 @@ def test_matrix_html_uses_bounded_matrix_data_and_escapes_script_text() -> None:
     assert "Target Availability" in document
     assert "setupMatrix('features'" in document
     assert '"</script>"' not in document
+
+
+def test_matrix_payload_run_length_encodes_status_codes() -> None:
+    codes = bytes([1] * 200 + [0, 2, 2])
+
+    assert _run_length_encode(codes) == bytes([1, 0xC8, 0x01, 0, 1, 2, 2])
+    assert _run_length_encode(b"") == b""
@@ -3,6 +3,7 @@ import math
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -553,6 +554,16 @@ def test_metadata_entries_preserve_scalar_and_list_statistics() -> None:
     }
 
 
+def test_metadata_entries_count_numpy_nan_list_elements() -> None:
+    stats = VectorMetadataStats(id="history", base_id="history")
+    stats.observe([np.float64("nan"), np.float64(1.0)], _hour(0))
+
+    (entry,) = metadata_entries_from_stats([stats])
+
+    assert entry.observed_elements == 1
+    assert type(stats.observed_elements) is int
+
+
 def test_window_bounds_modes():
     feature_stats = [
         VectorMetadataStats(
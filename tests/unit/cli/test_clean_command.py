@@ -20,7 +20,7 @@ def test_clean_command_dispatches(monkeypatch) -> None:
         calls["older_than"] = older_than
 
     monkeypatch.setattr(
-        "datapipeline.cli.command_router.handle_clean",
+        "datapipeline.cli.commands.clean.handle",
         handle_clean,
     )
     args = build_parser().parse_args(["clean", "--yes", "--older-than", "24h"])
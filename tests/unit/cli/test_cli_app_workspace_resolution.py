@@ -1,5 +1,7 @@
+import subprocess
 import sys
 from pathlib import Path
+from textwrap import dedent
 
 import pytest
 from datapipeline.cli import app
@@ -151,10 +153,11 @@ def test_resolve_project_from_args_requires_selection_without_workspace_default(
 
 
 def test_main_handles_keyboard_interrupt_at_top_level(monkeypatch, capsys):
-    monkeypatch.setattr(app, "load_workspace_context", lambda _cwd: None)
     monkeypatch.setattr(
-        app,
-        "execute_command",
+        "datapipeline.cli.workspace.load_workspace_context", lambda _cwd: None
+    )
+    monkeypatch.setattr(
+        "datapipeline.cli.command_router.execute_command",
         lambda **_kwargs: (_ for _ in ()).throw(KeyboardInterrupt()),
     )
     monkeypatch.setattr(
@@ -175,7 +178,9 @@ def test_main_parses_help_before_loading_workspace(monkeypatch, capsys):
     def fail_workspace_load(_cwd):
         raise AssertionError("help must not load the workspace")
 
-    monkeypatch.setattr(app, "load_workspace_context", fail_workspace_load)
+    monkeypatch.setattr(
+        "datapipeline.cli.workspace.load_workspace_context", fail_workspace_load
+    )
     monkeypatch.setattr(sys, "argv", ["jerry", "--help"])
 
     with pytest.raises(SystemExit) as exc:
@@ -185,6 +190,38 @@ def test_main_parses_help_before_loading_workspace(monkeypatch, capsys):
     assert "usage: jerry" in capsys.readouterr().out
 
 
+def test_help_exits_before_importing_command_modules() -> None:
+    script = dedent(
+        """
+        import sys
+
+        from datapipeline.cli import app
+
+        sys.argv = ["jerry", "--help"]
+        try:
+            app.main()
+        except SystemExit:
+            pass
+        heavy = {
+            "datapipeline.cli.command_router",
+            "datapipeline.cli.workspace",
+            "pydantic",
+        }
+        assert not heavy & sys.modules.keys(), sorted(heavy & sys.modules.keys())
+        """
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert "usage: jerry" in completed.stdout
+
+
 @pytest.mark.parametrize("command", ["version", "env", "clean"])
 def test_workspace_independent_commands_do_not_load_workspace(
     monkeypatch,
@@ -193,8 +230,12 @@ def test_workspace_independent_commands_do_not_load_workspace(
     def fail_workspace_load(_cwd):
         raise AssertionError(f"{command} must not load the workspace")
 
-    monkeypatch.setattr(app, "load_workspace_context", fail_workspace_load)
-    monkeypatch.setattr(app, "execute_command", lambda **_kwargs: True)
+    monkeypatch.setattr(
+        "datapipeline.cli.workspace.load_workspace_context", fail_workspace_load
+    )
+    monkeypatch.setattr(
+        "datapipeline.cli.command_router.execute_command", lambda **_kwargs: True
+    )
     monkeypatch.setattr(sys, "argv", ["jerry", command])
 
     app.main()
@@ -204,7 +245,9 @@ def test_main_reports_invalid_workspace_as_cli_error(monkeypatch, capsys):
     def load_invalid_workspace(_cwd):
         raise ValueError("invalid jerry.yaml")
 
-    monkeypatch.setattr(app, "load_workspace_context", load_invalid_workspace)
+    monkeypatch.setattr(
+        "datapipeline.cli.workspace.load_workspace_context", load_invalid_workspace
+    )
     monkeypatch.setattr(sys, "argv", ["jerry", "list", "sources"])
 
     with pytest.raises(SystemExit) as exc:
@@ -230,14 +273,18 @@ def test_main_resolves_project_for_serve_with_workspace_default(monkeypatch, tmp
             }
         ),
     )
-    monkeypatch.setattr(app, "load_workspace_context", lambda _cwd: workspace)
+    monkeypatch.setattr(
+        "datapipeline.cli.workspace.load_workspace_context", lambda _cwd: workspace
+    )
     captured: dict[str, object] = {}
 
     def _capture_execute_command(**kwargs):
         captured["project"] = kwargs["args"].project
         return True
 
-    monkeypatch.setattr(app, "execute_command", _capture_execute_command)
+    monkeypatch.setattr(
+        "datapipeline.cli.command_router.execute_command", _capture_execute_command
+    )
     monkeypatch.setattr(sys, "argv", ["jerry", "serve"])
 
     app.main()
@@ -25,7 +25,7 @@ def _execute(args, *, plugin_root=None, workspace=None) -> None:
 def test_plugin_name_dispatches_from_positional_argument(monkeypatch) -> None:
     captured: dict[str, object] = {}
     monkeypatch.setattr(
-        "datapipeline.cli.command_router.handle_plugin",
+        "datapipeline.cli.commands.plugin.handle",
         lambda **kwargs: captured.update(kwargs),
     )
 
@@ -37,7 +37,7 @@ def test_plugin_name_dispatches_from_positional_argument(monkeypatch) -> None:
 def test_domain_name_dispatches_from_positional_argument(monkeypatch) -> None:
     captured: dict[str, object] = {}
     monkeypatch.setattr(
-        "datapipeline.cli.command_router.handle_domain",
+        "datapipeline.cli.commands.domain.handle",
         lambda **kwargs: captured.update(kwargs),
     )
 
@@ -66,7 +66,7 @@ def test_list_route_forwards_plugin_and_workspace(
     )
     captured: dict[str, object] = {}
     monkeypatch.setattr(
-        "datapipeline.cli.command_router.handle_list",
+        "datapipeline.cli.commands.list_.handle",
         lambda **kwargs: captured.update(kwargs),
     )
 
@@ -49,7 +49,7 @@ def test_materialize_parser_accepts_profile_overrides() -> None:
 def test_materialize_dispatches_one_profile_execution_path(monkeypatch) -> None:
     captured = {}
     monkeypatch.setattr(
-        "datapipeline.cli.command_router.handle_materialize",
+        "datapipeline.cli.commands.materialize.handle",
         lambda **kwargs: captured.update(kwargs),
     )
     args = build_parser().parse_args(
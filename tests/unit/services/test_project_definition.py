@@ -252,13 +252,11 @@ def test_pipeline_yaml_inventory_surfaces_scan_errors(
     tmp_path: Path,
     monkeypatch,
 ) -> None:
-    def denied_walk(root, *, onerror, followlinks):
-        assert root == tmp_path
-        assert followlinks is False
-        onerror(PermissionError("denied"))
-        return ()
+    def denied_scandir(path):
+        assert path == str(tmp_path)
+        raise PermissionError("denied")
 
-    monkeypatch.setattr(config_inventory.os, "walk", denied_walk)
+    monkeypatch.setattr(config_inventory.os, "scandir", denied_scandir)
 
     with pytest.raises(PermissionError, match="denied"):
         config_inventory.pipeline_yaml_files(tmp_path)
@@ -1,6 +1,12 @@
+import numpy as np
 import pytest
 
-from datapipeline.transforms.utils import finite_number, get_field, partition_key
+from datapipeline.transforms.utils import (
+    finite_number,
+    get_field,
+    is_missing,
+    partition_key,
+)
 from tests.unit.transforms.helpers import make_time_record
 
 
@@ -38,3 +44,23 @@ def test_get_field_distinguishes_absent_from_missing() -> None:
 def test_finite_number_rejects_non_numeric_values(value: object) -> None:
     with pytest.raises(TypeError, match="numeric values"):
         finite_number(value, "value")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, True),
+        (float("nan"), True),
+        (0.0, False),
+        (0, False),
+        ("nan", False),
+        ([None], False),
+    ],
+)
+def test_is_missing_detects_none_and_nan_only(value: object, expected: bool) -> None:
+    assert is_missing(value) is expected
+
+
+def test_is_missing_detects_float_subclass_nan() -> None:
+    assert is_missing(np.float64("nan")) is True
+    assert is_missing(np.float64(1.0)) is False
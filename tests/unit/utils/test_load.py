@@ -23,6 +23,25 @@ def test_load_yaml_rejects_duplicate_mapping_keys(
         load.load_yaml(path)
 
 
+@pytest.mark.parametrize(
+    "yaml_text",
+    [
+        "value: first\nvalue: second\n",
+        "values: [1, 2\n",
+        "outer:\n\tvalue: 1\n",
+    ],
+)
+def test_load_yaml_errors_show_source_snippet(
+    tmp_path: Path,
+    yaml_text: str,
+) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml_text, encoding="utf-8")
+
+    with pytest.raises(ValueError, match=r"(?s)Invalid YAML.*\^"):
+        load.load_yaml(path)
+
+
 def test_load_yaml_allows_explicit_override_of_merged_defaults(
     tmp_path: Path,
 ) -> None: